@@ -1,8 +1,8 @@
 """Decentralized Creative Network Python library."""
 
-from .client import Client
+from .client import AsyncClient, Client
 
-__all__ = ["Client"]
+__all__ = ["AsyncClient", "Client"]
 
 __version__ = "0.1.0"
 __author__ = "hypermusic.ai"
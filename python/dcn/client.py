@@ -1,13 +1,38 @@
 from __future__ import annotations
 
+import asyncio
+import codecs
+import copy
+import importlib.util
+import json
+import logging
+import math
 import os
-from contextlib import AbstractContextManager, contextmanager
+import random
+import re
+import ssl
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from dataclasses import dataclass
+from functools import lru_cache
 from http import HTTPStatus
-from typing import Any, Generator, Mapping, Optional, TypeVar, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import httpx
-from eth_account import Account
 
 from .crypto import sign_login_nonce
 from .dcn_api_client.api.account import get_account, get_accounts
@@ -62,10 +87,54 @@ from .dcn_api_client.models.transformation_info_response import TransformationIn
 from .dcn_api_client.models.version_response import VersionResponse
 from .dcn_api_client.types import Response, UNSET, Unset
 
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional speedup
+    _orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from eth_account import Account
+
+logger = logging.getLogger(__name__)
+
 DEFAULT_BASE = "https://api.decentralised.art/chain"
+_KEEPALIVE_EXPIRY = 30.0
+
+# HTTP/2 is used by default whenever the optional `h2` package is installed.
+_HAS_H2 = importlib.util.find_spec("h2") is not None
+
+
+@lru_cache(maxsize=None)
+def _ssl_context(http2: bool) -> ssl.SSLContext:
+    """Verifying TLS context shared by every client, built once per HTTP/2 setting.
+
+    Loading the CA bundle dominates client construction, so it is done once per
+    process with httpx's own defaults. ``http2`` is intentionally unused: it only
+    keys the cache, because the transport sets ALPN protocols on the context it
+    is given and HTTP/1.1 and HTTP/2 clients must not share one.
+    """
+    return httpx.create_ssl_context()
+
+
+def _verify(verify_ssl: bool, http2: bool) -> Union[ssl.SSLContext, bool]:
+    return _ssl_context(http2) if verify_ssl else False
+
+
+_RETRY_STATUSES = frozenset({
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+# Transport failures worth another attempt; configuration errors such as
+# UnsupportedProtocol or ProxyError fail the same way every time.
+_TRANSIENT_ERRORS = (httpx.NetworkError, httpx.TimeoutException, httpx.RemoteProtocolError)
 
 T = TypeVar("T")
 
+_DynamicRi = Optional[Mapping[str, Union[RunningInstance, Mapping[str, object]]]]
+_ExecuteJob = Union[tuple[str, Union[int, str]], tuple[str, Union[int, str], _DynamicRi]]
+
 
 class DcnApiError(RuntimeError):
     """Error raised for non-2xx DCN API responses."""
@@ -80,6 +149,12 @@ def _optional(value: Optional[T]) -> Union[T, Unset]:
     return UNSET if value is None else value
 
 
+def _json_loads(content: bytes) -> object:
+    if _orjson is not None:
+        return cast(object, _orjson.loads(content))
+    return cast(object, json.loads(content))
+
+
 def _decode_error(response: Response[object]) -> object:
     if response.parsed is not None:
         return response.parsed
@@ -88,16 +163,41 @@ def _decode_error(response: Response[object]) -> object:
     content_type = response.headers.get("content-type", "")
     if "application/json" in content_type:
         try:
-            return httpx.Response(
-                int(response.status_code),
-                content=response.content,
-                headers=response.headers,
-            ).json()
+            return _json_loads(response.content)
         except ValueError:
             return response.content.decode(errors="replace")
     return response.content.decode(errors="replace")
 
 
+def _retry_delay(
+    backoff: float,
+    attempt: int,
+    request_kwargs: Mapping[str, Any],
+    reason: object,
+) -> float:
+    delay = backoff * 2.0**attempt
+    delay += random.uniform(0, delay / 2)
+    logger.debug(
+        "Retrying %s %s after %s (attempt %d, sleeping %.2fs)",
+        request_kwargs["method"],
+        request_kwargs["url"],
+        reason,
+        attempt + 1,
+        delay,
+    )
+    return delay
+
+
+def _should_retry(method: str, error: Optional[Exception], status_code: int) -> bool:
+    # Requests that never reached the server are always safe to resend; anything
+    # else is only retried for idempotent reads.
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+        return True
+    if method.upper() not in _IDEMPOTENT_METHODS:
+        return False
+    return isinstance(error, _TRANSIENT_ERRORS) or status_code in _RETRY_STATUSES
+
+
 def _expect(response: Response[object], typ: type[T]) -> T:
     if HTTPStatus.OK <= response.status_code < HTTPStatus.MULTIPLE_CHOICES:
         if isinstance(response.parsed, typ):
@@ -116,18 +216,304 @@ def _expect_list(response: Response[object], item_type: type[T]) -> list[T]:
     raise DcnApiError(int(response.status_code), _decode_error(response))
 
 
+def _exists(response: Response[object]) -> bool:
+    if response.status_code == HTTPStatus.NOT_FOUND:
+        return False
+    if HTTPStatus.OK <= response.status_code < HTTPStatus.MULTIPLE_CHOICES:
+        return True
+    raise DcnApiError(int(response.status_code), _decode_error(response))
+
+
 def _request_dict(request: Mapping[str, object] | T, typ: type[T]) -> T:
     if isinstance(request, typ):
         return request
     return cast(T, typ.from_dict(request))  # type: ignore[attr-defined]
 
 
+def _has_non_finite(value: object) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, Mapping):
+        return any(_has_non_finite(item) for item in cast(Mapping[str, object], value).values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in cast(Iterable[object], value))
+    return False
+
+
+def _orjson_body(payload: object) -> Optional[bytes]:
+    # orjson rejects integers beyond 64 bits and writes NaN/Infinity as null;
+    # such bodies are left to httpx's stdlib encoder so the wire format is the
+    # same with or without the speedups extra. The payload is only walked when
+    # the output contains "null", which is rare for generated request bodies.
+    if _orjson is None:
+        return None
+    try:
+        content = _orjson.dumps(payload)
+    except _orjson.JSONEncodeError:
+        return None
+    if b"null" in content and _has_non_finite(payload):
+        return None
+    return content
+
+
+def _request_kwargs(
+    module: Any,
+    token: Optional[str],
+    args: tuple[object, ...],
+    kwargs: Mapping[str, object],
+) -> dict[str, Any]:
+    request_kwargs = cast(dict[str, Any], module._get_kwargs(*args, **kwargs))
+    # _get_kwargs builds fresh dicts on every call, so headers are filled in place.
+    headers: dict[str, str] = request_kwargs.setdefault("headers", {})
+    if _orjson is not None and "json" in request_kwargs:
+        content = _orjson_body(request_kwargs["json"])
+        if content is not None:
+            del request_kwargs["json"]
+            request_kwargs["content"] = content
+            headers.setdefault("Content-Type", "application/json")
+    if token:
+        # Sent per request rather than set on the shared httpx client so
+        # concurrent public reads never carry the token.
+        headers["Authorization"] = f"Bearer {token}"
+    return request_kwargs
+
+
+def _build_response(
+    module: Any,
+    client: GeneratedClient | AuthenticatedClient,
+    response: httpx.Response,
+) -> Response[object]:
+    if HTTPStatus.OK <= response.status_code < HTTPStatus.MULTIPLE_CHOICES:
+        return cast(Response[object], module._build_response(client=client, response=response))
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=None,
+    )
+
+
+def _execute_request(
+    connector_name: str,
+    particles_count: int | str,
+    dynamic_ri: Optional[Mapping[str, RunningInstance | Mapping[str, object]]],
+) -> ExecuteRequest:
+    dynamic: ExecuteRequestDynamicRi | Unset = UNSET
+    if dynamic_ri is not None:
+        instances = ExecuteRequestDynamicRi()
+        for key, value in dynamic_ri.items():
+            instances[key] = _request_dict(value, RunningInstance)
+        dynamic = instances
+    return ExecuteRequest(
+        connector_name=connector_name,
+        particles_count=particles_count,
+        dynamic_ri=dynamic,
+    )
+
+
+def _copy_model(model: T) -> T:
+    # Generated code compares fields against the UNSET singleton by identity.
+    return copy.deepcopy(model, {id(UNSET): UNSET})
+
+
+def _job_args(job: _ExecuteJob) -> tuple[str, Union[int, str], _DynamicRi]:
+    connector_name, particles_count, *rest = job
+    return connector_name, particles_count, rest[0] if rest else None
+
+
+# Structural characters an element scan stops at: between elements (depth 0),
+# inside a nested container, and inside a string literal.
+_TOP_LEVEL_TOKEN = re.compile(r'[\[\]{}",]')
+_NESTED_TOKEN = re.compile(r'[\[\]{}"]')
+_STRING_TOKEN = re.compile(r'["\\]')
+
+
+class _JsonArrayDecoder:
+    """Incremental decoder for the elements of a top-level JSON array.
+
+    Element text is scanned once for its closing delimiter and decoded only when
+    complete, so the cost is linear however the response is chunked. Only the
+    element currently being received is held in memory.
+    """
+
+    __slots__ = ("_decoder", "_utf8", "_expect", "_parts", "_depth", "_in_string", "_escaped")
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._expect = "["
+        self._parts: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: bytes, final: bool = False) -> list[object]:
+        text = self._utf8.decode(chunk, final=final)
+        items: list[object] = []
+        pos = 0
+        while pos < len(text):
+            expect = self._expect
+            if expect == "value":
+                end = self._scan(text, pos)
+                if end < 0:
+                    self._parts.append(text[pos:])
+                    break
+                self._parts.append(text[pos:end])
+                items.append(self._decoder.decode("".join(self._parts)))
+                self._parts = []
+                self._expect = "next"
+                pos = end
+                continue
+            char = text[pos]
+            if char in " \t\n\r":
+                pos += 1
+            elif expect == "[":
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                self._expect = "first"
+                pos += 1
+            elif expect == "next" or (expect == "first" and char == "]"):
+                if char == "]":
+                    self._expect = "done"
+                elif char == ",":
+                    self._expect = "item"
+                else:
+                    raise ValueError(f"Unexpected {char!r} in JSON array")
+                pos += 1
+            elif expect == "done":
+                raise ValueError("Unexpected data after JSON array")
+            else:
+                self._expect = "value"
+        if final and self._expect != "done":
+            raise ValueError("Truncated JSON array")
+        return items
+
+    def _scan(self, text: str, pos: int) -> int:
+        """Return the index of the delimiter ending the current element, or -1."""
+        depth = self._depth
+        in_string = self._in_string
+        if self._escaped:
+            pos += 1
+            self._escaped = False
+        end = -1
+        while pos < len(text):
+            if in_string:
+                match = _STRING_TOKEN.search(text, pos)
+                if match is None:
+                    break
+                pos = match.end()
+                if match.group() == "\\":
+                    if pos == len(text):
+                        self._escaped = True
+                    pos += 1
+                else:
+                    in_string = False
+                continue
+            match = (_TOP_LEVEL_TOKEN if depth == 0 else _NESTED_TOKEN).search(text, pos)
+            if match is None:
+                break
+            char = match.group()
+            if char == '"':
+                in_string = True
+            elif char in "[{":
+                depth += 1
+            elif depth == 0:
+                end = match.start()
+                break
+            else:
+                depth -= 1
+            pos = match.end()
+        self._depth = depth
+        self._in_string = in_string
+        return end
+
+
+def _iter_json_array(chunks: Iterable[bytes]) -> Iterator[object]:
+    """Yield the elements of a top-level JSON array as its bytes arrive."""
+    decoder = _JsonArrayDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.feed(b"", final=True)
+
+
+def _feed_filters(
+    event_type: Optional[FeedEventType | str],
+    include_unfinalized: Optional[bool],
+) -> tuple[FeedEventType | Unset, GETFeedIncludeUnfinalized | Unset]:
+    feed_type = _optional(
+        FeedEventType(event_type) if isinstance(event_type, str) else event_type
+    )
+    include: GETFeedIncludeUnfinalized | Unset = UNSET
+    if include_unfinalized is not None:
+        include = (
+            GETFeedIncludeUnfinalized.VALUE_1
+            if include_unfinalized
+            else GETFeedIncludeUnfinalized.VALUE_0
+        )
+    return feed_type, include
+
+
+def _stream_params(since_seq: Optional[int], limit: Optional[int]) -> dict[str, int]:
+    return {
+        key: value
+        for key, value in {"since_seq": since_seq, "limit": limit}.items()
+        if value is not None
+    }
+
+
+class _LruCache:
+    """Bounded, thread-safe LRU map for registry definitions looked up by name."""
+
+    __slots__ = ("maxsize", "ttl", "_data", "_lock")
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[tuple[str, str], tuple[float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str]) -> Optional[object]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: tuple[str, str], value: object) -> None:
+        if self.maxsize <= 0:
+            return
+        expires = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: tuple[str, str]) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
 @dataclass
 class Client:
     """DCN Chain API facade.
 
     Defaults to `https://api.decentralised.art/chain`; override with `base_url`
     or `DCN_API_BASE`.
+
+    Published definitions are immutable, so `connector_get`, `transformation_get`
+    and `condition_get` results are cached per client instance; a fresh `Client`
+    always starts with an empty cache. Set `cache_ttl` to bound staleness, or
+    call `invalidate_cache()` to drop everything.
     """
 
     base_url: Optional[str] = None
@@ -136,8 +522,8 @@ class Client:
     access_token: Optional[str] = None
     """Bearer access token used for protected publish/execute endpoints."""
 
-    timeout: float = 15.0
-    """HTTP request timeout in seconds."""
+    timeout: Union[float, httpx.Timeout] = 15.0
+    """HTTP request timeout in seconds, or an `httpx.Timeout` for per-phase limits."""
 
     verify_ssl: bool = True
     """Whether to verify TLS certificates."""
@@ -145,13 +531,41 @@ class Client:
     transport: Optional[httpx.BaseTransport] = None
     """Optional custom httpx transport for tests or instrumentation."""
 
+    http2: Optional[bool] = None
+    """Use HTTP/2; defaults to on when the optional `h2` package is installed."""
+
+    max_retries: int = 3
+    """Retries for connection failures and transient 502/503/504 responses."""
+
+    retry_backoff: float = 0.3
+    """Base delay in seconds for exponential retry backoff."""
+
+    cache_size: int = 256
+    """Connector, transformation, and condition definitions kept in memory; 0 disables."""
+
+    cache_ttl: Optional[float] = None
+    """Seconds a cached definition stays valid; None keeps it until evicted."""
+
+    max_connections: int = 100
+    """Maximum concurrent connections in the shared pool."""
+
+    max_keepalive_connections: int = 20
+    """Idle connections kept open for reuse."""
+
     def __post_init__(self) -> None:
         base = (self.base_url or os.getenv("DCN_API_BASE") or DEFAULT_BASE).rstrip("/")
         timeout = httpx.Timeout(self.timeout)
+        http2 = _HAS_H2 if self.http2 is None else self.http2
         self._client = httpx.Client(
             base_url=base,
             timeout=timeout,
-            verify=self.verify_ssl,
+            verify=_verify(self.verify_ssl, http2),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=_KEEPALIVE_EXPIRY,
+            ),
+            http2=http2,
             transport=self.transport,
         )
         self._generated = GeneratedClient(
@@ -165,6 +579,7 @@ class Client:
             timeout=timeout,
             verify_ssl=self.verify_ssl,
         ).set_httpx_client(self._client)
+        self._cache = _LruCache(self.cache_size, self.cache_ttl)
 
     def close(self) -> None:
         """Close the underlying HTTP client."""
@@ -176,18 +591,28 @@ class Client:
     def __exit__(self, *exc_info: object) -> None:
         self.close()
 
-    @contextmanager
-    def _auth_headers(self) -> Generator[AuthenticatedClient, None, None]:
-        previous = self._client.headers.get("Authorization")
-        if self.access_token:
-            self._client.headers["Authorization"] = f"Bearer {self.access_token}"
-        try:
-            yield self._authenticated
-        finally:
-            if previous is None:
-                self._client.headers.pop("Authorization", None)
+    def invalidate_cache(self) -> None:
+        """Forget all cached definitions."""
+        self._cache.clear()
+
+    def _send(self, request_kwargs: dict[str, Any]) -> httpx.Response:
+        method = cast(str, request_kwargs["method"])
+        attempt = 0
+        while True:
+            try:
+                response = self._client.request(**request_kwargs)
+            except httpx.TransportError as exc:
+                if attempt >= self.max_retries or not _should_retry(method, exc, 0):
+                    raise
+                reason: object = exc
             else:
-                self._client.headers["Authorization"] = previous
+                if attempt >= self.max_retries or not _should_retry(
+                    method, None, response.status_code
+                ):
+                    return response
+                reason = response.status_code
+            time.sleep(_retry_delay(self.retry_backoff, attempt, request_kwargs, reason))
+            attempt += 1
 
     def _call(
         self,
@@ -196,23 +621,18 @@ class Client:
         *args: object,
         **kwargs: object,
     ) -> Response[object]:
-        request_kwargs = module._get_kwargs(*args, **kwargs)
-        response = self._client.request(**request_kwargs)
-        if HTTPStatus.OK <= response.status_code < HTTPStatus.MULTIPLE_CHOICES:
-            return cast(Response[object], module._build_response(client=client, response=response))
-        return Response(
-            status_code=HTTPStatus(response.status_code),
-            content=response.content,
-            headers=response.headers,
-            parsed=None,
-        )
-
-    def _exists(self, response: Response[object]) -> bool:
-        if response.status_code == HTTPStatus.NOT_FOUND:
-            return False
-        if HTTPStatus.OK <= response.status_code < HTTPStatus.MULTIPLE_CHOICES:
-            return True
-        raise DcnApiError(int(response.status_code), _decode_error(response))
+        token = self.access_token if client is self._authenticated else None
+        response = self._send(_request_kwargs(module, token, args, kwargs))
+        return _build_response(module, client, response)
+
+    def _registry_get(self, kind: str, module: Any, name: str, typ: type[T]) -> T:
+        # Models are mutable, so callers never share the cached instance.
+        cached = self._cache.get((kind, name))
+        if isinstance(cached, typ):
+            return _copy_model(cached)
+        resp = _expect(self._call(module, self._generated, name), typ)
+        self._cache.put((kind, name), _copy_model(resp))
+        return resp
 
     def version(self) -> VersionResponse:
         """Get chain API version metadata.
@@ -306,17 +726,14 @@ class Client:
 
         Returns true when the connector exists, false on 404.
         """
-        return self._exists(self._call(head_connector, self._generated, name))
+        return _exists(self._call(head_connector, self._generated, name))
 
     def connector_get(self, name: str) -> ConnectorInfoResponse:
         """Get connector by name.
 
         Returns connector definition, owner, address, and derived format hash.
         """
-        return _expect(
-            self._call(get_connector, self._generated, name),
-            ConnectorInfoResponse,
-        )
+        return self._registry_get("connector", get_connector, name, ConnectorInfoResponse)
 
     def connector_post(
         self,
@@ -326,30 +743,33 @@ class Client:
 
         Requires bearer authentication.
         """
-        with self._auth_headers() as client:
-            return _expect(
-                self._call(
-                    post_connector,
-                    client,
-                    body=_request_dict(request, CreateConnectorRequest),
-                ),
-                CreateConnectorResponse,
-            )
+        resp = _expect(
+            self._call(
+                post_connector,
+                self._authenticated,
+                body=_request_dict(request, CreateConnectorRequest),
+            ),
+            CreateConnectorResponse,
+        )
+        self._cache.pop(("connector", resp.name))
+        return resp
 
     def transformation_exists(self, name: str) -> bool:
         """Check transformation existence.
 
         Returns true when the transformation exists, false on 404.
         """
-        return self._exists(self._call(head_transformation, self._generated, name))
+        return _exists(self._call(head_transformation, self._generated, name))
 
     def transformation_get(self, name: str) -> TransformationInfoResponse:
         """Get transformation by name.
 
         Returns transformation source metadata, owner, and deployed address.
         """
-        return _expect(
-            self._call(get_transformation, self._generated, name),
+        return self._registry_get(
+            "transformation",
+            get_transformation,
+            name,
             TransformationInfoResponse,
         )
 
@@ -361,32 +781,30 @@ class Client:
 
         Requires bearer authentication.
         """
-        with self._auth_headers() as client:
-            return _expect(
-                self._call(
-                    post_transformation,
-                    client,
-                    body=_request_dict(request, CreateTransformationRequest),
-                ),
-                CreateTransformationResponse,
-            )
+        resp = _expect(
+            self._call(
+                post_transformation,
+                self._authenticated,
+                body=_request_dict(request, CreateTransformationRequest),
+            ),
+            CreateTransformationResponse,
+        )
+        self._cache.pop(("transformation", resp.name))
+        return resp
 
     def condition_exists(self, name: str) -> bool:
         """Check condition existence.
 
         Returns true when the condition exists, false on 404.
         """
-        return self._exists(self._call(head_condition, self._generated, name))
+        return _exists(self._call(head_condition, self._generated, name))
 
     def condition_get(self, name: str) -> ConditionInfoResponse:
         """Get condition by name.
 
         Returns condition source metadata, owner, and deployed address.
         """
-        return _expect(
-            self._call(get_condition, self._generated, name),
-            ConditionInfoResponse,
-        )
+        return self._registry_get("condition", get_condition, name, ConditionInfoResponse)
 
     def condition_post(
         self,
@@ -396,15 +814,16 @@ class Client:
 
         Requires bearer authentication.
         """
-        with self._auth_headers() as client:
-            return _expect(
-                self._call(
-                    post_condition,
-                    client,
-                    body=_request_dict(request, CreateConditionRequest),
-                ),
-                CreateConditionResponse,
-            )
+        resp = _expect(
+            self._call(
+                post_condition,
+                self._authenticated,
+                body=_request_dict(request, CreateConditionRequest),
+            ),
+            CreateConditionResponse,
+        )
+        self._cache.pop(("condition", resp.name))
+        return resp
 
     def execute(
         self,
@@ -417,27 +836,62 @@ class Client:
         `particles_count` accepts protobuf JSON uint32 values and rejects values
         greater than 65536. Requires bearer authentication.
         """
-        dynamic: ExecuteRequestDynamicRi | Unset = UNSET
-        if dynamic_ri is not None:
-            dynamic = ExecuteRequestDynamicRi.from_dict(
-                {
-                    key: value.to_dict() if isinstance(value, RunningInstance) else dict(value)
-                    for key, value in dynamic_ri.items()
-                }
-            )
-        with self._auth_headers() as client:
-            return _expect_list(
-                self._call(
-                    post_execute,
-                    client,
-                    body=ExecuteRequest(
-                        connector_name=connector_name,
-                        particles_count=particles_count,
-                        dynamic_ri=dynamic,
-                    ),
-                ),
-                ParticlesResultItem,
-            )
+        return _expect_list(
+            self._call(
+                post_execute,
+                self._authenticated,
+                body=_execute_request(connector_name, particles_count, dynamic_ri),
+            ),
+            ParticlesResultItem,
+        )
+
+    def execute_iter(
+        self,
+        connector_name: str,
+        particles_count: int | str,
+        dynamic_ri: Optional[Mapping[str, RunningInstance | Mapping[str, object]]] = None,
+    ) -> Iterator[ParticlesResultItem]:
+        """Execute a connector and yield results while the response streams in.
+
+        Same request as `execute`, but the body is decoded incrementally instead
+        of being buffered whole. Requires bearer authentication.
+        """
+        request_kwargs = _request_kwargs(
+            post_execute,
+            self.access_token,
+            (),
+            {"body": _execute_request(connector_name, particles_count, dynamic_ri)},
+        )
+        with self._client.stream(**request_kwargs) as response:
+            if not HTTPStatus.OK <= response.status_code < HTTPStatus.MULTIPLE_CHOICES:
+                response.read()
+                error = _build_response(post_execute, self._authenticated, response)
+                raise DcnApiError(response.status_code, _decode_error(error))
+            for item in _iter_json_array(response.iter_bytes()):
+                yield ParticlesResultItem.from_dict(cast(Mapping[str, Any], item))
+
+    def execute_many(
+        self,
+        jobs: Iterable[_ExecuteJob],
+        *,
+        max_concurrency: int = 10,
+    ) -> list[list[ParticlesResultItem]]:
+        """Execute several connectors concurrently.
+
+        Each job is `(connector_name, particles_count[, dynamic_ri])`; results keep
+        job order. If a job fails, jobs not yet started are cancelled and the error
+        is raised. Requires bearer authentication.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+            futures = [pool.submit(self.execute, *_job_args(job)) for job in jobs]
+            try:
+                return [future.result() for future in futures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
 
     def list_formats(self, *, limit: int = 50, after: Optional[str] = None) -> FormatListResponse:
         """List connector format hashes known to the registry.
@@ -489,16 +943,7 @@ class Client:
         Returns newest-first feed items with compact payload metadata. Hydrate
         full details via entity endpoints.
         """
-        feed_type = _optional(
-            FeedEventType(event_type) if isinstance(event_type, str) else event_type
-        )
-        include: GETFeedIncludeUnfinalized | Unset = UNSET
-        if include_unfinalized is not None:
-            include = (
-                GETFeedIncludeUnfinalized.VALUE_1
-                if include_unfinalized
-                else GETFeedIncludeUnfinalized.VALUE_0
-            )
+        feed_type, include = _feed_filters(event_type, include_unfinalized)
         return _expect(
             self._call(
                 get_feed,
@@ -524,9 +969,532 @@ class Client:
         return self._client.stream(
             "GET",
             "feed/stream",
-            params={
-                key: value
-                for key, value in {"since_seq": since_seq, "limit": limit}.items()
-                if value is not None
-            },
+            params=_stream_params(since_seq, limit),
+        )
+
+
+@dataclass
+class AsyncClient:
+    """Asynchronous DCN Chain API facade.
+
+    Mirrors `Client` on top of `httpx.AsyncClient`; endpoint methods are coroutines,
+    and definition lookups are cached per instance the same way.
+    """
+
+    base_url: Optional[str] = None
+    """Chain API base URL."""
+
+    access_token: Optional[str] = None
+    """Bearer access token used for protected publish/execute endpoints."""
+
+    timeout: Union[float, httpx.Timeout] = 15.0
+    """HTTP request timeout in seconds, or an `httpx.Timeout` for per-phase limits."""
+
+    verify_ssl: bool = True
+    """Whether to verify TLS certificates."""
+
+    transport: Optional[httpx.AsyncBaseTransport] = None
+    """Optional custom httpx async transport for tests or instrumentation."""
+
+    http2: Optional[bool] = None
+    """Use HTTP/2; defaults to on when the optional `h2` package is installed."""
+
+    max_retries: int = 3
+    """Retries for connection failures and transient 502/503/504 responses."""
+
+    retry_backoff: float = 0.3
+    """Base delay in seconds for exponential retry backoff."""
+
+    cache_size: int = 256
+    """Connector, transformation, and condition definitions kept in memory; 0 disables."""
+
+    cache_ttl: Optional[float] = None
+    """Seconds a cached definition stays valid; None keeps it until evicted."""
+
+    max_connections: int = 100
+    """Maximum concurrent connections in the shared pool."""
+
+    max_keepalive_connections: int = 20
+    """Idle connections kept open for reuse."""
+
+    def __post_init__(self) -> None:
+        base = (self.base_url or os.getenv("DCN_API_BASE") or DEFAULT_BASE).rstrip("/")
+        timeout = httpx.Timeout(self.timeout)
+        http2 = _HAS_H2 if self.http2 is None else self.http2
+        self._client = httpx.AsyncClient(
+            base_url=base,
+            timeout=timeout,
+            verify=_verify(self.verify_ssl, http2),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=_KEEPALIVE_EXPIRY,
+            ),
+            http2=http2,
+            transport=self.transport,
+        )
+        self._generated = GeneratedClient(
+            base_url=base,
+            timeout=timeout,
+            verify_ssl=self.verify_ssl,
+        ).set_async_httpx_client(self._client)
+        self._authenticated = AuthenticatedClient(
+            base_url=base,
+            token="",
+            timeout=timeout,
+            verify_ssl=self.verify_ssl,
+        ).set_async_httpx_client(self._client)
+        self._cache = _LruCache(self.cache_size, self.cache_ttl)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    def invalidate_cache(self) -> None:
+        """Forget all cached definitions."""
+        self._cache.clear()
+
+    async def _send(self, request_kwargs: dict[str, Any]) -> httpx.Response:
+        method = cast(str, request_kwargs["method"])
+        attempt = 0
+        while True:
+            try:
+                response = await self._client.request(**request_kwargs)
+            except httpx.TransportError as exc:
+                if attempt >= self.max_retries or not _should_retry(method, exc, 0):
+                    raise
+                reason: object = exc
+            else:
+                if attempt >= self.max_retries or not _should_retry(
+                    method, None, response.status_code
+                ):
+                    return response
+                reason = response.status_code
+            await asyncio.sleep(
+                _retry_delay(self.retry_backoff, attempt, request_kwargs, reason)
+            )
+            attempt += 1
+
+    async def _call(
+        self,
+        module: Any,
+        client: GeneratedClient | AuthenticatedClient,
+        *args: object,
+        **kwargs: object,
+    ) -> Response[object]:
+        token = self.access_token if client is self._authenticated else None
+        response = await self._send(_request_kwargs(module, token, args, kwargs))
+        return _build_response(module, client, response)
+
+    async def _registry_get(self, kind: str, module: Any, name: str, typ: type[T]) -> T:
+        # Models are mutable, so callers never share the cached instance.
+        cached = self._cache.get((kind, name))
+        if isinstance(cached, typ):
+            return _copy_model(cached)
+        resp = _expect(await self._call(module, self._generated, name), typ)
+        self._cache.put((kind, name), _copy_model(resp))
+        return resp
+
+    async def version(self) -> VersionResponse:
+        """Get chain API version metadata.
+
+        Returns service version and build timestamp.
+        """
+        return _expect(
+            await self._call(get_version, self._generated),
+            VersionResponse,
+        )
+
+    async def get_nonce(self, address: str) -> NonceResponse:
+        """Get a one-time nonce for an address.
+
+        Sign `Login nonce: <nonce>` and submit it to `login_with_signature`.
+        """
+        return _expect(
+            await self._call(get_nonce, self._generated, address),
+            NonceResponse,
+        )
+
+    async def login_with_signature(
+        self,
+        address: str,
+        message: str,
+        signature: str,
+    ) -> AuthResponse:
+        """Authenticate using an address, signed login message, and signature.
+
+        Stores the returned bearer token on this client for protected endpoints.
+        """
+        resp = _expect(
+            await self._call(
+                post_auth,
+                self._generated,
+                body=AuthRequest(address=address, message=message, signature=signature),
+            ),
+            AuthResponse,
+        )
+        self.access_token = resp.access_token
+        return resp
+
+    async def login_with_account(self, account: Account) -> AuthResponse:
+        """Authenticate with an eth-account account.
+
+        Fetches a nonce, signs `Login nonce: <nonce>` in a worker thread, then
+        stores the returned bearer token.
+        """
+        address = cast(str, getattr(account, "address"))
+        nonce = (await self.get_nonce(address)).nonce
+        message, signature = await asyncio.to_thread(sign_login_nonce, account, nonce)
+        return await self.login_with_signature(address, message, signature)
+
+    async def list_accounts(
+        self,
+        *,
+        limit: int = 50,
+        after: Optional[str] = None,
+    ) -> AccountListResponse:
+        """List chain accounts known to the registry.
+
+        Uses cursor-based pagination.
+        """
+        return _expect(
+            await self._call(
+                get_accounts,
+                self._generated,
+                limit=limit,
+                after=_optional(after),
+            ),
+            AccountListResponse,
+        )
+
+    async def account_info(
+        self,
+        address: str,
+        *,
+        limit: int = 50,
+        after_connectors: Optional[str] = None,
+        after_transformations: Optional[str] = None,
+        after_conditions: Optional[str] = None,
+    ) -> AccountInfoResponse:
+        """Get owned connectors, transformations, and conditions for an address.
+
+        Each ownership list has its own cursor.
+        """
+        return _expect(
+            await self._call(
+                get_account,
+                self._generated,
+                address,
+                limit=limit,
+                after_connectors=_optional(after_connectors),
+                after_transformations=_optional(after_transformations),
+                after_conditions=_optional(after_conditions),
+            ),
+            AccountInfoResponse,
+        )
+
+    async def connector_exists(self, name: str) -> bool:
+        """Check connector existence.
+
+        Returns true when the connector exists, false on 404.
+        """
+        return _exists(await self._call(head_connector, self._generated, name))
+
+    async def connector_get(self, name: str) -> ConnectorInfoResponse:
+        """Get connector by name.
+
+        Returns connector definition, owner, address, and derived format hash.
+        """
+        return await self._registry_get(
+            "connector",
+            get_connector,
+            name,
+            ConnectorInfoResponse,
+        )
+
+    async def connector_get_many(self, names: Iterable[str]) -> list[ConnectorInfoResponse]:
+        """Get several connectors concurrently.
+
+        Results keep the order of `names`.
+        """
+        return list(await asyncio.gather(*(self.connector_get(name) for name in names)))
+
+    async def connector_post(
+        self,
+        request: CreateConnectorRequest | Mapping[str, object],
+    ) -> CreateConnectorResponse:
+        """Publish a connector definition.
+
+        Requires bearer authentication.
+        """
+        resp = _expect(
+            await self._call(
+                post_connector,
+                self._authenticated,
+                body=_request_dict(request, CreateConnectorRequest),
+            ),
+            CreateConnectorResponse,
+        )
+        self._cache.pop(("connector", resp.name))
+        return resp
+
+    async def transformation_exists(self, name: str) -> bool:
+        """Check transformation existence.
+
+        Returns true when the transformation exists, false on 404.
+        """
+        return _exists(await self._call(head_transformation, self._generated, name))
+
+    async def transformation_get(self, name: str) -> TransformationInfoResponse:
+        """Get transformation by name.
+
+        Returns transformation source metadata, owner, and deployed address.
+        """
+        return await self._registry_get(
+            "transformation",
+            get_transformation,
+            name,
+            TransformationInfoResponse,
+        )
+
+    async def transformation_get_many(
+        self,
+        names: Iterable[str],
+    ) -> list[TransformationInfoResponse]:
+        """Get several transformations concurrently.
+
+        Results keep the order of `names`.
+        """
+        return list(await asyncio.gather(*(self.transformation_get(name) for name in names)))
+
+    async def transformation_post(
+        self,
+        request: CreateTransformationRequest | Mapping[str, object],
+    ) -> CreateTransformationResponse:
+        """Publish a transformation definition.
+
+        Requires bearer authentication.
+        """
+        resp = _expect(
+            await self._call(
+                post_transformation,
+                self._authenticated,
+                body=_request_dict(request, CreateTransformationRequest),
+            ),
+            CreateTransformationResponse,
+        )
+        self._cache.pop(("transformation", resp.name))
+        return resp
+
+    async def condition_exists(self, name: str) -> bool:
+        """Check condition existence.
+
+        Returns true when the condition exists, false on 404.
+        """
+        return _exists(await self._call(head_condition, self._generated, name))
+
+    async def condition_get(self, name: str) -> ConditionInfoResponse:
+        """Get condition by name.
+
+        Returns condition source metadata, owner, and deployed address.
+        """
+        return await self._registry_get(
+            "condition",
+            get_condition,
+            name,
+            ConditionInfoResponse,
+        )
+
+    async def condition_get_many(self, names: Iterable[str]) -> list[ConditionInfoResponse]:
+        """Get several conditions concurrently.
+
+        Results keep the order of `names`.
+        """
+        return list(await asyncio.gather(*(self.condition_get(name) for name in names)))
+
+    async def condition_post(
+        self,
+        request: CreateConditionRequest | Mapping[str, object],
+    ) -> CreateConditionResponse:
+        """Publish a condition definition.
+
+        Requires bearer authentication.
+        """
+        resp = _expect(
+            await self._call(
+                post_condition,
+                self._authenticated,
+                body=_request_dict(request, CreateConditionRequest),
+            ),
+            CreateConditionResponse,
+        )
+        self._cache.pop(("condition", resp.name))
+        return resp
+
+    async def execute(
+        self,
+        connector_name: str,
+        particles_count: int | str,
+        dynamic_ri: Optional[Mapping[str, RunningInstance | Mapping[str, object]]] = None,
+    ) -> list[ParticlesResultItem]:
+        """Execute a connector.
+
+        `particles_count` accepts protobuf JSON uint32 values and rejects values
+        greater than 65536. Requires bearer authentication.
+        """
+        return _expect_list(
+            await self._call(
+                post_execute,
+                self._authenticated,
+                body=_execute_request(connector_name, particles_count, dynamic_ri),
+            ),
+            ParticlesResultItem,
+        )
+
+    async def execute_iter(
+        self,
+        connector_name: str,
+        particles_count: int | str,
+        dynamic_ri: Optional[Mapping[str, RunningInstance | Mapping[str, object]]] = None,
+    ) -> AsyncIterator[ParticlesResultItem]:
+        """Execute a connector and yield results while the response streams in.
+
+        Same request as `execute`, but the body is decoded incrementally instead
+        of being buffered whole. Requires bearer authentication.
+        """
+        request_kwargs = _request_kwargs(
+            post_execute,
+            self.access_token,
+            (),
+            {"body": _execute_request(connector_name, particles_count, dynamic_ri)},
+        )
+        async with self._client.stream(**request_kwargs) as response:
+            if not HTTPStatus.OK <= response.status_code < HTTPStatus.MULTIPLE_CHOICES:
+                await response.aread()
+                error = _build_response(post_execute, self._authenticated, response)
+                raise DcnApiError(response.status_code, _decode_error(error))
+            decoder = _JsonArrayDecoder()
+            async for chunk in response.aiter_bytes():
+                for item in decoder.feed(chunk):
+                    yield ParticlesResultItem.from_dict(cast(Mapping[str, Any], item))
+            for item in decoder.feed(b"", final=True):
+                yield ParticlesResultItem.from_dict(cast(Mapping[str, Any], item))
+
+    async def execute_many(
+        self,
+        jobs: Iterable[_ExecuteJob],
+        *,
+        max_concurrency: int = 10,
+    ) -> list[list[ParticlesResultItem]]:
+        """Execute several connectors concurrently.
+
+        Each job is `(connector_name, particles_count[, dynamic_ri])`; results keep
+        job order. If a job fails, the remaining jobs are cancelled and the error
+        is raised. Requires bearer authentication.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(job: _ExecuteJob) -> list[ParticlesResultItem]:
+            async with semaphore:
+                return await self.execute(*_job_args(job))
+
+        tasks = [asyncio.ensure_future(run(job)) for job in jobs]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def list_formats(
+        self,
+        *,
+        limit: int = 50,
+        after: Optional[str] = None,
+    ) -> FormatListResponse:
+        """List connector format hashes known to the registry.
+
+        Uses cursor-based pagination.
+        """
+        return _expect(
+            await self._call(
+                get_formats,
+                self._generated,
+                limit=limit,
+                after=_optional(after),
+            ),
+            FormatListResponse,
+        )
+
+    async def format_info(
+        self,
+        format_hash: str,
+        *,
+        limit: int = 50,
+        after: Optional[str] = None,
+    ) -> FormatInfoResponse:
+        """Get format membership.
+
+        Lists connector names and scalar labels for a format hash.
+        """
+        return _expect(
+            await self._call(
+                get_format,
+                self._generated,
+                format_hash,
+                limit=limit,
+                after=_optional(after),
+            ),
+            FormatInfoResponse,
+        )
+
+    async def feed(
+        self,
+        *,
+        limit: int = 50,
+        before: Optional[str] = None,
+        event_type: Optional[FeedEventType | str] = None,
+        include_unfinalized: Optional[bool] = None,
+    ) -> FeedPage:
+        """List feed items.
+
+        Returns newest-first feed items with compact payload metadata. Hydrate
+        full details via entity endpoints.
+        """
+        feed_type, include = _feed_filters(event_type, include_unfinalized)
+        return _expect(
+            await self._call(
+                get_feed,
+                self._generated,
+                limit=limit,
+                before=_optional(before),
+                type_=feed_type,
+                include_unfinalized=include,
+            ),
+            FeedPage,
+        )
+
+    def feed_stream(
+        self,
+        *,
+        since_seq: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> AbstractAsyncContextManager[httpx.Response]:
+        """Open the feed Server-Sent Events stream.
+
+        Starts with bounded replay from `since_seq`, then tails live feed deltas.
+        """
+        return self._client.stream(
+            "GET",
+            "feed/stream",
+            params=_stream_params(since_seq, limit),
         )
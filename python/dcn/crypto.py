@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from eth_account import Account
-from eth_account.messages import encode_defunct
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from eth_account import Account
 
 
 def sign_login_nonce(account: Account, nonce: str) -> tuple[str, str]:
+    # Imported lazily: eth_account pulls in eth_keys/rlp and dominates `import dcn`.
+    from eth_account.messages import encode_defunct
+
     message_text = f"Login nonce: {nonce}"
     sig = account.sign_message(encode_defunct(text=message_text)).signature.hex()
     return message_text, sig
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+
+from dcn.client import AsyncClient, DcnApiError
+
+from fixtures import ADDR, FORMAT, ApiRouter
+
+
+class TestDcnAsyncClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.router = ApiRouter()
+        self.client = AsyncClient(
+            base_url="https://example.invalid/chain",
+            transport=httpx.MockTransport(self.router),
+            retry_backoff=0.0,
+        )
+
+    async def asyncTearDown(self) -> None:
+        await self.client.aclose()
+
+    def last_request(self) -> httpx.Request:
+        return self.router.requests[-1]
+
+    async def test_version_uses_chain_base_url(self) -> None:
+        out = await self.client.version()
+        self.assertEqual(out.version, "0.4.0")
+        self.assertEqual(str(self.last_request().url), "https://example.invalid/chain/version")
+
+    async def test_login_with_account_sets_access_token(self) -> None:
+        account = SimpleNamespace(address=ADDR)
+        with patch("dcn.client.sign_login_nonce", return_value=("Login nonce: abcd-efgh", "0xSIG")):
+            out = await self.client.login_with_account(account)  # type: ignore[arg-type]
+        self.assertEqual(out.access_token, "access-123")
+        self.assertEqual(self.client.access_token, "access-123")
+        self.assertEqual(
+            json.loads(self.last_request().content.decode()),
+            {"address": ADDR, "message": "Login nonce: abcd-efgh", "signature": "0xSIG"},
+        )
+
+    async def test_definition_lookups_gather_and_cache(self) -> None:
+        connectors = await self.client.connector_get_many(["pitch", "melody", "pitch"])
+        self.assertEqual([item.name for item in connectors], ["pitch", "melody", "pitch"])
+        self.assertEqual(connectors[0].format_hash, FORMAT)
+
+        transformations = await self.client.transformation_get_many(["identity"])
+        self.assertEqual(transformations[0].sol_src, "return x;")
+        conditions = await self.client.condition_get_many(["always"])
+        self.assertEqual(conditions[0].sol_src, "return true;")
+
+        requests_made = len(self.router.requests)
+        await self.client.connector_get("melody")
+        self.assertEqual(len(self.router.requests), requests_made)
+
+        self.assertTrue(await self.client.connector_exists("pitch"))
+        self.assertFalse(await self.client.transformation_exists("missing"))
+        self.assertTrue(await self.client.condition_exists("always"))
+
+    async def test_publish_and_execute_attach_bearer(self) -> None:
+        self.client.access_token = "access-123"
+        created = await self.client.condition_post({"name": "gate", "sol_src": "return true;"})
+        self.assertEqual(created.name, "gate")
+        self.assertEqual(self.last_request().headers["authorization"], "Bearer access-123")
+
+        out = await self.client.execute(
+            "pitch", 8, {"0": {"start_point": 12, "transformation_shift": 3}}
+        )
+        self.assertEqual(out[0].path, "/pitch")
+        body = json.loads(self.last_request().content.decode())
+        self.assertEqual(body["dynamic_ri"]["0"]["start_point"], 12)
+
+        streamed = [item.path async for item in self.client.execute_iter("pitch", 8)]
+        self.assertEqual(streamed, ["/pitch"])
+
+    async def test_execute_many_keeps_job_order(self) -> None:
+        self.client.access_token = "access-123"
+        out = await self.client.execute_many(
+            [("pitch", 8), ("melody", "4", {"0": {"start_point": 1, "transformation_shift": 0}})],
+            max_concurrency=2,
+        )
+        self.assertEqual([result[0].path for result in out], ["/pitch", "/melody"])
+        self.assertEqual(len(self.router.requests), 2)
+        with self.assertRaises(ValueError):
+            await self.client.execute_many([("pitch", 8)], max_concurrency=0)
+
+    async def test_execute_many_cancels_remaining_jobs_on_failure(self) -> None:
+        started = asyncio.Event()
+        cancelled: list[str] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            name = json.loads(request.content.decode())["connector_name"]
+            if name == "broken":
+                await started.wait()
+                return httpx.Response(400, json={"message": "no such connector"})
+            started.set()
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+            return httpx.Response(200, json=[])
+
+        async with AsyncClient(
+            access_token="access-123",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            with self.assertRaises(DcnApiError):
+                await client.execute_many([("broken", 1), ("slow", 1)], max_concurrency=2)
+        self.assertEqual(cancelled, ["slow"])
+
+    async def test_listing_and_feed_endpoints(self) -> None:
+        self.assertEqual((await self.client.list_accounts(limit=2)).accounts, [ADDR])
+        info = await self.client.account_info(ADDR, after_conditions="always")
+        self.assertEqual(info.owned_conditions, ["always"])
+        self.assertEqual((await self.client.list_formats()).formats, [FORMAT])
+        self.assertEqual((await self.client.format_info(FORMAT)).connectors, ["pitch"])
+
+        feed = await self.client.feed(event_type="connector_added", include_unfinalized=False)
+        self.assertEqual(feed.items[0].event_type.value, "connector_added")
+        query = dict(self.last_request().url.params)
+        self.assertEqual(query["include_unfinalized"], "0")
+
+        async with self.client.feed_stream(since_seq=10) as response:
+            self.assertIn("event: stream_meta", (await response.aread()).decode())
+        self.assertEqual(dict(self.last_request().url.params), {"since_seq": "10"})
+
+    async def test_context_manager_closes_client(self) -> None:
+        async with AsyncClient(transport=httpx.MockTransport(self.router)) as client:
+            await client.get_nonce(ADDR)
+        self.assertTrue(client._client.is_closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
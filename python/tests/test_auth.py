@@ -37,6 +37,15 @@ class TestDcnAuth(unittest.TestCase):
             {"address": ADDR, "message": "Login nonce: abcd-efgh", "signature": "0xSIG"},
         )
 
+    def test_login_reuses_pooled_http_client_for_protected_calls(self) -> None:
+        http_client = self.client._client
+        self.client.login_with_signature(ADDR, "Login nonce: abcd-efgh", "0xSIG")
+
+        self.assertIs(self.client._client, http_client)
+        self.assertFalse(http_client.is_closed)
+        self.client.execute("pitch", 8)
+        self.assertEqual(self.last_request().headers["authorization"], "Bearer access-123")
+
     def test_login_with_account_sets_access_token(self) -> None:
         account = SimpleNamespace(address=ADDR)
         with patch("dcn.client.sign_login_nonce", return_value=("Login nonce: abcd-efgh", "0xSIG")):
@@ -4,23 +4,8 @@ import io
 import json
 import sys
 import unittest
-from types import ModuleType
 from unittest.mock import patch
 
-try:
-    import eth_account  # type: ignore
-except Exception:
-    eth_account = ModuleType("eth_account")
-    eth_account_messages = ModuleType("eth_account.messages")
-
-    class Account:
-        pass
-
-    eth_account_messages.encode_defunct = lambda text: text
-    eth_account.Account = Account
-    sys.modules["eth_account"] = eth_account
-    sys.modules["eth_account.messages"] = eth_account_messages
-
 from dcn import cli
 
 
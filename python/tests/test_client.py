@@ -1,12 +1,23 @@
 from __future__ import annotations
 
 import json
+import time
 import unittest
 from unittest.mock import patch
 
+import attrs
 import httpx
 
-from dcn.client import Client, DcnApiError
+import dcn.client as client_module
+from dcn.client import (
+    Client,
+    DcnApiError,
+    _copy_model,
+    _iter_json_array,
+    _orjson_body,
+    _verify,
+)
+from dcn.dcn_api_client.types import UNSET, Unset
 
 from fixtures import ADDR, FORMAT, ApiRouter
 
@@ -18,6 +29,7 @@ class TestDcnClient(unittest.TestCase):
             base_url="https://example.invalid/chain",
             access_token="access-123",
             transport=httpx.MockTransport(self.router),
+            retry_backoff=0.0,
         )
 
     def last_request(self) -> httpx.Request:
@@ -45,6 +57,20 @@ class TestDcnClient(unittest.TestCase):
         self.client.execute("pitch", 8)
         self.assertEqual(self.last_request().headers["authorization"], "Bearer access-123")
 
+    def test_bearer_is_sent_per_request_not_stored_on_shared_client(self) -> None:
+        self.client.execute("pitch", 8)
+        self.assertNotIn("authorization", self.client._client.headers)
+
+        self.client.access_token = "access-456"
+        self.client.transformation_post({"name": "shift", "sol_src": "return x + 1;"})
+        self.assertEqual(self.last_request().headers["authorization"], "Bearer access-456")
+
+    def test_tls_context_is_built_once_and_shared(self) -> None:
+        context = _verify(True, False)
+        self.assertIs(_verify(True, False), context)
+        self.assertIsNot(_verify(True, True), context)
+        self.assertIs(_verify(False, False), False)
+
     def test_account_endpoints(self) -> None:
         listed = self.client.list_accounts(limit=2, after=ADDR)
         self.assertEqual(listed.accounts, [ADDR])
@@ -84,6 +110,79 @@ class TestDcnClient(unittest.TestCase):
             },
         )
 
+    def test_definition_lookups_are_cached_per_client(self) -> None:
+        first = self.client.connector_get("pitch")
+        first.name = "edited"
+        second = self.client.connector_get("pitch")
+        self.assertEqual(second.name, "pitch")
+        self.assertEqual(second.format_hash, FORMAT)
+        self.client.transformation_get("identity")
+        self.client.transformation_get("identity")
+        self.client.condition_get("always")
+        self.client.condition_get("always")
+        self.assertEqual(len(self.router.requests), 3)
+
+        self.client.transformation_post({"name": "identity", "sol_src": "return x;"})
+        self.client.transformation_get("identity")
+        self.assertEqual(len(self.router.requests), 5)
+
+        uncached = Client(
+            base_url="https://example.invalid/chain",
+            transport=httpx.MockTransport(self.router),
+            cache_size=0,
+        )
+        uncached.connector_get("pitch")
+        uncached.connector_get("pitch")
+        self.assertEqual(len(self.router.requests), 7)
+
+    def test_cached_copies_keep_unset_identity(self) -> None:
+        @attrs.define
+        class Model:
+            tags: list[str]
+            owner: str | Unset = UNSET
+
+        original = Model(tags=["a"])
+        copied = _copy_model(original)
+        copied.tags.append("b")
+        self.assertEqual(original.tags, ["a"])
+        self.assertIs(copied.owner, UNSET)
+
+        self.client.connector_get("pitch")
+        first = self.client.connector_get("pitch")
+        second = self.client.connector_get("pitch")
+        for field in attrs.fields(type(first)):
+            if getattr(first, field.name) is UNSET:
+                self.assertIs(getattr(second, field.name), UNSET)
+
+    def test_timeout_accepts_per_phase_limits(self) -> None:
+        self.assertEqual(self.client._client.timeout, httpx.Timeout(15.0))
+        staged = Client(
+            transport=httpx.MockTransport(self.router),
+            timeout=httpx.Timeout(30.0, connect=5.0, pool=5.0),
+        )
+        self.assertEqual(staged._client.timeout.connect, 5.0)
+        self.assertEqual(staged._client.timeout.read, 30.0)
+        staged.close()
+
+    def test_definition_cache_expires_and_can_be_invalidated(self) -> None:
+        self.client.connector_get("pitch")
+        self.client.invalidate_cache()
+        self.client.connector_get("pitch")
+        self.assertEqual(len(self.router.requests), 2)
+
+        expiring = Client(
+            base_url="https://example.invalid/chain",
+            transport=httpx.MockTransport(self.router),
+            cache_ttl=60.0,
+        )
+        expiring.connector_get("pitch")
+        expiring.connector_get("pitch")
+        self.assertEqual(len(self.router.requests), 3)
+        with patch("dcn.client.time.monotonic", return_value=time.monotonic() + 61.0):
+            expiring.connector_get("pitch")
+        self.assertEqual(len(self.router.requests), 4)
+        expiring.close()
+
     def test_transformation_and_condition_endpoints(self) -> None:
         self.assertTrue(self.client.transformation_exists("identity"))
         self.assertFalse(self.client.transformation_exists("missing"))
@@ -126,6 +225,73 @@ class TestDcnClient(unittest.TestCase):
             {"connector_name": "pitch", "particles_count": "8"},
         )
 
+    def test_request_bodies_encode_with_and_without_orjson(self) -> None:
+        huge = 2**70
+        self.client.execute("pitch", 8, {"0": {"start_point": huge, "transformation_shift": 1}})
+        body = json.loads(self.last_request().content.decode())
+        self.assertEqual(body["dynamic_ri"]["0"]["start_point"], huge)
+
+        with patch("dcn.client._orjson", None):
+            self.client.execute("pitch", 8, {"0": {"start_point": 3, "transformation_shift": 1}})
+        request = self.last_request()
+        self.assertEqual(request.headers["content-type"], "application/json")
+        self.assertEqual(json.loads(request.content.decode())["dynamic_ri"]["0"]["start_point"], 3)
+
+    @unittest.skipIf(client_module._orjson is None, "orjson is not installed")
+    def test_orjson_encodes_bodies_it_can_represent_exactly(self) -> None:
+        self.client.transformation_post({"name": "shift", "sol_src": "return null;"})
+        self.assertEqual(self.last_request().headers["content-type"], "application/json")
+
+        self.assertIsNotNone(_orjson_body({"sol_src": "return null;", "owner": None}))
+        self.assertIsNone(_orjson_body({"start_point": 2**70}))
+        self.assertIsNone(_orjson_body({"values": [1.0, float("nan")]}))
+
+    def test_execute_iter_streams_results(self) -> None:
+        out = list(self.client.execute_iter("pitch", 8))
+        self.assertEqual([item.path for item in out], ["/pitch"])
+        self.assertEqual(self.last_request().headers["authorization"], "Bearer access-123")
+        self.assertEqual(
+            [item.to_dict() for item in out],
+            [item.to_dict() for item in self.client.execute("pitch", 8)],
+        )
+
+        with self.assertRaises(DcnApiError) as raised:
+            list(Client(
+                base_url="https://example.invalid/other",
+                transport=httpx.MockTransport(lambda request: httpx.Response(401)),
+            ).execute_iter("pitch", 8))
+        self.assertEqual(raised.exception.status_code, 401)
+
+    def test_iter_json_array_handles_split_chunks(self) -> None:
+        data = [{"path": "/pitch", "data": [1, -2.5e3]}, 12, "a,]", None]
+        raw = json.dumps(data).encode()
+        for size in (1, 3, len(raw)):
+            chunks = [raw[i:i + size] for i in range(0, len(raw), size)]
+            self.assertEqual(list(_iter_json_array(chunks)), data)
+
+        with self.assertRaises(ValueError):
+            list(_iter_json_array([b"[1, 2"]))
+
+    def test_iter_json_array_decodes_large_element_from_small_chunks(self) -> None:
+        item = {
+            "path": "/pitch",
+            "data": [i * 0.5 for i in range(50_000)],
+            "labels": ['a "quoted" ]', "back\\slash", "[{"] * 100,
+        }
+        raw = json.dumps([item, item]).encode()
+        chunks = [raw[i:i + 997] for i in range(0, len(raw), 997)]
+        self.assertEqual(list(_iter_json_array(chunks)), [item, item])
+
+    def test_execute_many_keeps_job_order(self) -> None:
+        out = self.client.execute_many(
+            [("pitch", 8), ("melody", "4", {"0": {"start_point": 1, "transformation_shift": 0}})],
+            max_concurrency=2,
+        )
+        self.assertEqual([result[0].path for result in out], ["/pitch", "/melody"])
+        self.assertEqual(len(self.router.requests), 2)
+        with self.assertRaises(ValueError):
+            self.client.execute_many([("pitch", 8)], max_concurrency=0)
+
     def test_format_and_feed_endpoints(self) -> None:
         self.assertEqual(self.client.list_formats(limit=4, after=FORMAT).formats, [FORMAT])
         self.assertEqual(dict(self.last_request().url.params)["after"], FORMAT)
@@ -178,6 +344,58 @@ class TestDcnClient(unittest.TestCase):
         self.assertEqual(head_raised.exception.status_code, 503)
         self.assertEqual(head_raised.exception.body, "temporarily down")
 
+    def test_transient_errors_are_retried(self) -> None:
+        with self.assertRaises(DcnApiError):
+            self.client.connector_exists("broken")
+        self.assertEqual(len(self.router.requests), 4)
+
+        attempts: list[httpx.Request] = []
+
+        def flaky(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("connection refused", request=request)
+            return self.router(request)
+
+        client = Client(
+            base_url="https://example.invalid/chain",
+            transport=httpx.MockTransport(flaky),
+            retry_backoff=0.0,
+        )
+        out = client.login_with_signature(ADDR, "Login nonce: abcd-efgh", "0xSIG")
+        self.assertEqual(out.access_token, "access-123")
+        self.assertEqual(len(attempts), 2)
+
+    def test_non_transient_failures_are_not_retried(self) -> None:
+        attempts: list[httpx.Request] = []
+
+        def unavailable(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            return httpx.Response(503)
+
+        client = Client(
+            base_url="https://example.invalid/chain",
+            access_token="access-123",
+            transport=httpx.MockTransport(unavailable),
+            retry_backoff=0.0,
+        )
+        with self.assertRaises(DcnApiError):
+            client.execute("pitch", 8)
+        self.assertEqual(len(attempts), 1)
+
+        def misconfigured(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            raise httpx.UnsupportedProtocol("unsupported", request=request)
+
+        client = Client(
+            base_url="https://example.invalid/chain",
+            transport=httpx.MockTransport(misconfigured),
+            retry_backoff=0.0,
+        )
+        with self.assertRaises(httpx.UnsupportedProtocol):
+            client.version()
+        self.assertEqual(len(attempts), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
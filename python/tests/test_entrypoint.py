@@ -1,14 +1,29 @@
 from __future__ import annotations
 
+import subprocess
+import sys
 import unittest
+from pathlib import Path
 
-from dcn import Client as PublicClient
-from dcn.client import Client
+from dcn import AsyncClient as PublicAsyncClient, Client as PublicClient
+from dcn.client import AsyncClient, Client
 
 
 class TestEntrypoint(unittest.TestCase):
     def test_exports_public_client_facade(self) -> None:
         self.assertIs(PublicClient, Client)
+        self.assertIs(PublicAsyncClient, AsyncClient)
+
+    def test_import_does_not_load_eth_account(self) -> None:
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, dcn, dcn.cli; assert 'eth_account' not in sys.modules",
+            ],
+            cwd=Path(__file__).resolve().parents[1],
+            check=True,
+        )
 
 
 if __name__ == "__main__":